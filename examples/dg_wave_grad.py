@@ -91,11 +91,8 @@ def variant_2(t_unit, nwork_items_per_cell=4, ncells_per_workgroup=8):
     return t_unit
 
 
-def variant_3(t_unit):
-    ncells_per_workgroup = 9
+def variant_3(t_unit, *, j_tile_len=9, i_tile_len=35, ncells_per_workgroup=9):
     nworkitems_per_cell = 7
-    j_tile_len = 9
-    i_tile_len = 35
 
     # {{{ term hoisting to match the flop count of opt_einsum
 
@@ -127,7 +124,12 @@ def variant_3(t_unit):
                                                            "i_inner"]),
                              temporary_address_space=lp.AddressSpace.PRIVATE,
                              temporary_name="J_prftch",
+                             default_tag="unr",
                              )
+    # the reduction over 'r' reading 'J_prftch' must be unrolled as well,
+    # else 'J_prftch' is indexed by a loop variable and may spill from
+    # registers.
+    t_unit = lp.tag_inames(t_unit, {"r": "unr"})
 
     # {{{ TODO: Make precompute smarter (should be a single precompute call)
 
@@ -209,10 +211,14 @@ def variant_3(t_unit):
 
     # {{{ make buffer array smarter (should be a single call to buffer_array)
 
+    # keep one accumulator per 'x' in registers. With 'x' and 'r' both
+    # unrolled, each 'tmp_hoist' value is loaded once and feeds all the ndim
+    # accumulators.
     t_unit = lp.buffer_array(t_unit, "_fe_out", buffer_inames=["x"],
                              init_expression="0",
-                             default_tag=None,
+                             default_tag="unr",
                              temporary_scope=lp.AddressSpace.PRIVATE)
+    t_unit = lp.tag_inames(t_unit, {"x": "unr"})
     t_unit = lp.privatize_temporaries_with_inames(t_unit, "i_outer",
                                                   only_var_names={"_fe_out_buf"})
 
@@ -291,7 +297,57 @@ def paranumal_transform(t_unit):
     return t_unit
 
 
+def classify_bound(expr, dev, long_dim_length=100_000):
+    """
+    Returns *"memory"* if the arithmetic intensity of *expr* lies below the
+    ridge point of *dev*'s float64 roofline, else returns *"compute"*.
+    """
+    from pymbolic.mapper.evaluator import evaluate_to_float
+    from feinsum.einsum import SizeParam
+    from feinsum.measure import _get_giga_ops_from_einsum, _get_footprint_gbytes
+    from feinsum.data.device_info import DEV_TO_PEAK_GFLOPS, DEV_TO_PEAK_BW
+
+    eval_context = {dim.name: long_dim_length
+                    for dim in expr.index_to_dim_length().values()
+                    if isinstance(dim, SizeParam)}
+    giga_ops = sum(evaluate_to_float(ops, eval_context)
+                   for ops in _get_giga_ops_from_einsum(expr).values())
+    arithmetic_intensity = (giga_ops
+                            / _get_footprint_gbytes(expr, long_dim_length))
+    ridge_point = DEV_TO_PEAK_GFLOPS[dev.name]["float64"] / DEV_TO_PEAK_BW[dev.name]
+
+    return "memory" if arithmetic_intensity < ridge_point else "compute"
+
+
+def get_tile_lens(bound, ndofs, ndim, local_mem_size, max_work_group_size,
+                  nworkitems_per_cell=7):
+    # Every work-group of variant_3 fetches all of 'R' into local memory once
+    # and shares it among its ncells_per_workgroup cells => the cells per
+    # work-group set how often 'R' is re-read from global memory. The tile
+    # lengths along 'i', 'j' do not change the global traffic: 'i' covers all
+    # ndofs and 'j' only trades barriers against local memory.
+    # memory-bound => as many cells per work-group as fit; compute-bound =>
+    # keep the work-groups small for a higher occupancy.
+    i_tile_len = ndofs
+    j_tile_len = 9
+    ncells_per_workgroup = {
+        "memory": max_work_group_size // nworkitems_per_cell,
+        "compute": 9}[bound]
+
+    def local_mem_footprint(ncells_per_workgroup):
+        # float64 'R_prftch' + 'u_prftch' tiles of variant_3
+        return 8 * j_tile_len * (ndim * i_tile_len + ncells_per_workgroup)
+
+    while local_mem_footprint(ncells_per_workgroup) > local_mem_size:
+        ncells_per_workgroup -= 1
+
+    assert ncells_per_workgroup > 0
+    return {"j_tile_len": j_tile_len, "i_tile_len": i_tile_len,
+            "ncells_per_workgroup": ncells_per_workgroup}
+
+
 def main():
+    from functools import partial
     from feinsum.data.device_info import DEV_TO_PEAK_GFLOPS
     cl_ctx = cl.create_some_context()
 
@@ -302,12 +358,25 @@ def main():
         logger.info("Device not known.")
         return
 
-    expr = get_grad_einsum(ndofs=35, ndim=3)
+    ndofs = 35
+    expr = get_grad_einsum(ndofs=ndofs, ndim=3)
     print(f.stringify_comparison_vs_roofline(expr,
                                              cl_ctx=cl_ctx,
                                              transform=paranumal_transform,
                                              ))
 
+    dev, = cl_ctx.devices
+    bound = classify_bound(expr, dev)
+    tile_lens = get_tile_lens(bound, ndofs, ndim=3,
+                              local_mem_size=dev.local_mem_size,
+                              max_work_group_size=dev.max_work_group_size)
+    logger.info(f"Grad einsum is {bound}-bound, using {tile_lens}.")
+    print(f.stringify_comparison_vs_roofline(
+        expr,
+        cl_ctx=cl_ctx,
+        transform=partial(variant_3, **tile_lens),
+    ))
+
 
 if __name__ == "__main__":
     main()
@@ -1,38 +1,56 @@
 import feinsum as f
-import pyopencl as cl
 import numpy as np
+import loopy as lp
 import logging
-logging.basicConfig(level="INFO")
+logger = logging.getLogger(__name__)
 
 
-cl_ctx = cl.create_some_context()
+# This file also serves as the transform source that gets recorded into the
+# database => must define a callable named 'transform'.
 
-expr = f.fused_einsum("ij,j->i",
-                      [(np.inf, 4), (4, )],
-                      dtypes="float64",
-                      use_matrix=[
-                          [{"a"}, {"c"}],
-                          [{"b"}, {"c"}],
-                      ])
+def get_einsum():
+    return f.fused_einsum("ij,j->i",
+                          [(np.inf, 4), (4, )],
+                          dtypes="float64",
+                          use_matrix=[
+                              [{"a"}, {"c"}],
+                              [{"b"}, {"c"}],
+                          ])
 
 
-transform_src = """import loopy as lp
-import feinsum as f
-import numpy as np
-
-def transform(t_unit, insn_match=None):
-    ref_einsum = f.fused_einsum("ij,j->i",
-                                [(np.inf, 4), (4, )],
-                                dtypes="float64",
-                                use_matrix=[
-                                    [{"a"}, {"c"}],
-                                    [{"b"}, {"c"}],
-                                ])
-    subst_map = f.match_t_unit_to_einsum(t_unit, ref_einsum)
+def transform(t_unit, insn_match=None, kernel_name=None):
+    subst_map = f.match_t_unit_to_einsum(t_unit, get_einsum())
     i = subst_map["i"]
-    return lp.split_iname(t_unit, i, 32, inner_tag='l.0', outer_tag='g.0')
-"""
+    return lp.split_iname(t_unit, i, 32, inner_tag="l.0", outer_tag="g.0")
+
+
+def main():
+    import pyopencl as cl
+    logging.basicConfig(level="INFO")
+
+    cl_ctx = cl.create_some_context()
+    # Rows are stored under the normalized einsum => generate and time the
+    # kernel for it too, so that 'cl_kernel' uses the stored argument names.
+    expr = f.normalize_einsum(get_einsum())
+    long_dim_length = 500_000
+
+    # The driver inspects the generated code and times the kernel anyway, so
+    # record those results as is instead of having f.record redo them.
+    cl_kernel = (lp.generate_code_v2(transform(f.generate_loopy(expr)))
+                 .device_code())
+    logger.info(f"Generated device code:\n{cl_kernel}")
+
+    runtime = f.timeit(expr, cl_ctx=cl_ctx, transform=transform,
+                       long_dim_length=long_dim_length)
+    logger.info(f"Runtime: {runtime * 1e6:.1f} us")
+
+    f.record_result(expr, cl_ctx,
+                    runtime=runtime,
+                    transform_file_path=__file__,
+                    cl_kernel=cl_kernel,
+                    authors="kk",
+                    long_dim_length=long_dim_length)
 
 
-f.record(expr, cl_ctx, transform_str=transform_src, authors="kk",
-         long_dim_length=500_000)
+if __name__ == "__main__":
+    main()
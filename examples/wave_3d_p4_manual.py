@@ -114,7 +114,12 @@ def transform_grad(t_unit, insn_match=None, kernel_name=None):
                                                            i_inner]),
                              temporary_address_space=lp.AddressSpace.PRIVATE,
                              temporary_name=J_prftch,
+                             default_tag="unr",
                              )
+    # the reduction over 'r' reading 'J_prftch' must be unrolled as well,
+    # else 'J_prftch' is indexed by a loop variable and may spill from
+    # registers.
+    t_unit = lp.tag_inames(t_unit, {r: "unr"})
 
     # {{{ TODO: Make precompute smarter (should be a single precompute call)
 
@@ -193,10 +198,14 @@ def transform_grad(t_unit, insn_match=None, kernel_name=None):
 
     # {{{ make buffer array smarter (should be a single call to buffer_array)
 
+    # keep one accumulator per 'x' in registers. With 'x' and 'r' both
+    # unrolled, each 'tmp_hoist' value is loaded once and feeds all the ndim
+    # accumulators.
     t_unit = lp.buffer_array(t_unit, out, buffer_inames=[x],
                              init_expression="0",
-                             default_tag=None,
+                             default_tag="unr",
                              temporary_scope=lp.AddressSpace.PRIVATE)
+    t_unit = lp.tag_inames(t_unit, {x: "unr"})
     t_unit = lp.privatize_temporaries_with_inames(t_unit, i_outer,
                                                   only_var_names={f"{out}_buf"})
 
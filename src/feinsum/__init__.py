@@ -10,7 +10,7 @@ from feinsum.codegen.loopy import (generate_loopy,
 from feinsum.measure import (timeit, measure_giga_op_rate,
                              stringify_comparison_vs_roofline,
                              get_roofline_flop_rate)
-from feinsum.database import record, query
+from feinsum.database import record, record_result, record_many, query
 from feinsum.loopy_utils import (match_t_unit_to_einsum,
                                  extract_einsum_terms_as_subst,
                                  hoist_reduction_invariant_terms,
@@ -32,7 +32,7 @@ __all__ = (
 
     "get_opt_einsum_contraction_schedule", "get_trivial_contraction_schedule",
 
-    "record", "query",
+    "record", "record_result", "record_many", "query",
 
     "match_t_unit_to_einsum", "hoist_reduction_invariant_terms",
     "extract_einsum_terms_as_subst", "match_einsum",
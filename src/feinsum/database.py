@@ -1,5 +1,7 @@
 """
 .. autofunction:: record
+.. autofunction:: record_result
+.. autofunction:: record_many
 .. autofunction:: query
 .. autoclass:: QueryInfo
 """
@@ -12,12 +14,17 @@ import numpy as np
 import loopy as lp
 import numpy.typing as npt
 
+from contextlib import closing
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from typing import (TYPE_CHECKING, Optional, Union, Callable,
-                    Tuple, FrozenSet, Any, Dict)
+                    Tuple, FrozenSet, Any, Dict, Iterable, Sequence,
+                    Mapping)
 from pyrsistent.typing import PMap as PMapT
 from pyrsistent import pmap
-from feinsum.einsum import FusedEinsum, INT_CLASSES, SizeParam
+from feinsum.einsum import (FusedEinsum, INT_CLASSES, SizeParam,
+                            EinsumAxisAccess, ShapeComponentT)
 from feinsum.cl_utils import ContextT
 
 logger = logging.getLogger(__name__)
@@ -26,6 +33,7 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING or getattr(sys, "FEINSUM_BUILDING_SPHINX_DOCS", False):
     # avoid making pyopencl a hard dep.
     import pyopencl as cl
+    from zoneinfo import ZoneInfo
 
 
 # transform: (t_unit, insn_match, kernel_name)
@@ -40,6 +48,9 @@ DEFAULT_TRANSFORM_ARCHIVE = os.path.join(os.path.dirname(__file__),
                                          "../../data/transform_archive_v1.db")
 
 
+# transform sources are re-read for every query/record of the same entry =>
+# compile them only once.
+@lru_cache(maxsize=256)
 def _get_clbl_from_string(transform_src: str) -> TransformT:
 
     result_dict: Dict[Any, Any] = {}
@@ -56,31 +67,36 @@ def _get_clbl_from_string(transform_src: str) -> TransformT:
 
 def _get_value_to_dtype_for_db(einsum: FusedEinsum) -> str:
     return ("["
-            + ", ".join(f"{val}: {dtype.name}"
-                           for val, dtype in sorted(einsum
-                                                    .value_to_dtype
-                                                    .items()))
+            + ", ".join([f"{val}: {dtype.name}"
+                         for val, dtype in sorted(einsum.value_to_dtype.items())])
             + "]")
 
 
-def _get_index_to_length_for_db(einsum: FusedEinsum) -> str:
-    return "[" + ", ".join(f"{einsum.index_names[k]}: {v}"
-                           for k, v in einsum.index_to_dim_length().items()
-                           if isinstance(v, INT_CLASSES)) + "]"
+def _get_index_to_length_for_db(
+        einsum: FusedEinsum,
+        index_to_dim_length: Mapping[EinsumAxisAccess, ShapeComponentT]) -> str:
+    index_names = einsum.index_names
+    return "[" + ", ".join([f"{index_names[k]}: {v}"
+                            for k, v in index_to_dim_length.items()
+                            if isinstance(v, INT_CLASSES)]) + "]"
+
+
+def _stringify_use_row(use_row: Tuple[FrozenSet[str], ...]) -> str:
+    return "[" + ", ".join(["[" + ", ".join(sorted(uses)) + "]"
+                            for uses in use_row]) + "]"
 
 
 def _get_use_matrix_for_db(einsum: FusedEinsum) -> str:
-    def _stringify_use_row(use_row: Tuple[FrozenSet[str], ...]) -> str:
-        normalized_use_row = [sorted({use
-                                      for use in uses})
-                              for uses in use_row]
-        return ("["
-                + ", ".join("[" + ", ".join(uses) + "]"
-                            for uses in normalized_use_row)
-                + "]")
+    return "[" + ",\n".join([_stringify_use_row(use_row)
+                             for use_row in einsum.use_matrix]) + "]"
+
 
-    return "[" + ",\n".join(_stringify_use_row(use_row)
-                            for use_row in einsum.use_matrix) + "]"
+def _get_eval_context(
+        index_to_dim_length: Mapping[EinsumAxisAccess, ShapeComponentT],
+        long_dim_length: int) -> Dict[str, int]:
+    return {dim.name: long_dim_length
+            for dim in index_to_dim_length.values()
+            if isinstance(dim, SizeParam)}
 
 
 def _get_cl_version_for_db(cl_device: "cl.Device") -> str:
@@ -88,15 +104,17 @@ def _get_cl_version_for_db(cl_device: "cl.Device") -> str:
     return f"{cl_device.vendor}-{cl_device.driver_version}"
 
 
-def _get_op_info_for_db(einsum: FusedEinsum, long_dim_length: int) -> str:
+def _get_dtype_to_ops(einsum: FusedEinsum,
+                      eval_context: Mapping[str, int]
+                      ) -> Dict[np.dtype[Any], float]:
     from feinsum.measure import _get_giga_ops_from_einsum
     from pymbolic.mapper.evaluator import evaluate_to_float
 
-    eval_context = {dim.name: long_dim_length
-                    for dim in einsum.index_to_dim_length().values()
-                    if isinstance(dim, SizeParam)}
-    dtype_to_ops = {k: evaluate_to_float(v, eval_context)
-                    for k, v in _get_giga_ops_from_einsum(einsum).items()}
+    return {k: evaluate_to_float(v, eval_context)
+            for k, v in _get_giga_ops_from_einsum(einsum).items()}
+
+
+def _get_op_info_for_db(dtype_to_ops: Mapping[np.dtype[Any], float]) -> str:
     return "\n".join(f"{k.name}: {v}"
                      for k, v in dtype_to_ops.items())
 
@@ -113,70 +131,90 @@ def _postprocess_op_info_from_sql(op_info: str) -> PMapT[np.dtype[Any], float]:
 def _get_log_str_for_run(einsum: FusedEinsum,
                          runtime: float,
                          device: "cl.Device",
-                         long_dim_length: int) -> str:
+                         long_dim_length: int,
+                         dtype_to_ops: Mapping[np.dtype[Any], float]) -> str:
 
-    from feinsum.measure import (_get_giga_ops_from_einsum,
-                                 _strify_measured_vs_roofline,
+    from feinsum.measure import (_strify_measured_vs_roofline,
                                  get_roofline_flop_rate)
-    from pymbolic.mapper.evaluator import evaluate_to_float
 
-    eval_context = {dim.name: long_dim_length
-                    for dim in einsum.index_to_dim_length().values()
-                    if isinstance(dim, SizeParam)}
-    measured_rate = {k: evaluate_to_float(v, eval_context)/runtime
-                     for k, v in _get_giga_ops_from_einsum(einsum).items()}
+    measured_rate = {k: v/runtime for k, v in dtype_to_ops.items()}
     roofline_rate = get_roofline_flop_rate(einsum, device.name,
                                            long_dim_length)
     return _strify_measured_vs_roofline(measured_rate, roofline_rate)
 
 
+# maps characters in a device name that are invalid in a SQL table name.
+_DEV_NAME_TO_TABLE_NAME = str.maketrans({" ": "_",
+                                         "-": "_",
+                                         "@": "AT",
+                                         "(": "_",
+                                         ")": "_",
+                                         ".": "DOT"})
+
+
 def _get_cl_device_name_for_db(cl_device: "cl.Device") -> str:
     dev_name = cl_device.name
     assert isinstance(dev_name, str)
-    return (dev_name
-            .replace(" ", "_")
-            .replace("-", "_")
-            .replace("@", "AT")
-            .replace("(", "_")
-            .replace(")", "_")
-            .replace(".", "DOT")
-            )
+    return dev_name.translate(_DEV_NAME_TO_TABLE_NAME)
 
 
 def _preprocess_string_for_sql(value: str) -> str:
-    if value.find("''") != -1 or value.find("\\n") != -1:
+    # newlines are stored escaped to stay compatible with the existing
+    # archives, quoting is taken care of by sqlite's parameter binding.
+    if value.find("\\n") != -1:
         raise NotImplementedError
 
-    return value.replace("\n", "\\n").replace("'", "''")
+    return value.replace("\n", "\\n")
 
 
 def _postprocess_string_from_sql(value: str) -> str:
-    return value.replace("\\n", "\n").replace("''", "'")
+    return value.replace("\\n", "\n")
 
 
-def record(einsum: FusedEinsum,
-           cl_ctx: "cl.Context",
-           *,
-           transform_str: Optional[str] = None,
-           transform_file_path: Optional[str] = None,
-           authors: str,
-           remarks: str = "",
-           database: str = DEFAULT_TRANSFORM_ARCHIVE,
-           long_dim_length: int = 50_000,
-           log_performance_data: bool = True,
-           ) -> None:
+def _connect(database: str, *, read_only: bool = False) -> sqlite3.Connection:
     """
-    :param log_performance_data: If *True* will log the run results via
-        :mod:`logging`.
+    Returns a new connection to *database*. Writable connections switch the
+    database to WAL mode with relaxed syncing since writes to a transform
+    archive are mostly bulk inserts of small rows. Read-only connections leave
+    the database file untouched.
     """
-
-    from feinsum.measure import timeit
-    from feinsum.codegen.loopy import generate_loopy
-    from feinsum.normalization import normalize_einsum
-    einsum = normalize_einsum(einsum)
-
-    # TODO: Instead of taking in a long_dim_length, should allow setting each
-    # parameter its value.
+    if read_only:
+        from urllib.request import pathname2url
+        conn = sqlite3.connect(f"file:{pathname2url(os.path.abspath(database))}"
+                               "?mode=ro",
+                               uri=True)
+    else:
+        conn = sqlite3.connect(database)
+        # journal_mode is persisted in the database file => only set on writes.
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA mmap_size=268435456;")
+    return conn
+
+
+def _create_device_table_if_needed(conn: sqlite3.Connection,
+                                   device_name: str) -> None:
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {device_name} ("
+                 " ID INTEGER PRIMARY KEY AUTOINCREMENT,"
+                 " subscripts TEXT,"
+                 " index_to_length TEXT,"
+                 " use_matrix TEXT,"
+                 " value_to_dtype TEXT,"
+                 " loopy_transform TEXT,"
+                 " runtime_in_sec REAL,"
+                 " authors TEXT,"
+                 " compiler_version TEXT,"
+                 " cl_kernel TEXT,"
+                 " giga_op_info TEXT,"
+                 " timestamp TEXT,"
+                 " remarks TEXT"
+                 ")")
+
+
+def _get_transform_str(transform_str: Optional[str],
+                       transform_file_path: Optional[str]) -> str:
     if (transform_str is not None) and (transform_file_path is not None):
         raise ValueError("Cannot pass in both transform_str"
                          " and transform_file_path.")
@@ -191,65 +229,82 @@ def record(einsum: FusedEinsum,
             transform_str = fp.read()
 
     assert transform_str is not None
-    transform_clbl = _get_clbl_from_string(transform_str)
+    return transform_str
+
+
+# timestamps of the recorded runs are in Chicago's time. Built lazily so that
+# importing feinsum does not require the IANA time zone data.
+@lru_cache(maxsize=1)
+def _get_chicago_tz() -> "ZoneInfo":
+    from zoneinfo import ZoneInfo
+    return ZoneInfo("America/Chicago")
+
+
+def _measure_runtime(einsum: FusedEinsum,
+                     cl_ctx: "cl.Context",
+                     *,
+                     transform_str: str,
+                     long_dim_length: int) -> float:
+    from feinsum.measure import timeit
+    from feinsum.normalization import normalize_einsum
 
     # type-ignored because last 2 arguments are optional arguments and mypy
     # cannot deduce that.
-    runtime = timeit(einsum,
-                     transform=transform_clbl,  # type: ignore
-                     cl_ctx=cl_ctx,
-                     long_dim_length=long_dim_length)
+    return timeit(normalize_einsum(einsum),
+                  transform=_get_clbl_from_string(transform_str),  # type: ignore
+                  cl_ctx=cl_ctx,
+                  long_dim_length=long_dim_length)
 
-    conn = sqlite3.connect(database)
 
-    if len(cl_ctx.devices) > 1:
-        raise NotImplementedError("CL contexts with multiple devices not supported")
+# loopy's codegen is slow => avoid regenerating the device code when the same
+# (einsum, transform) pair is recorded again.
+@lru_cache(maxsize=64)
+def _generate_device_code(einsum: FusedEinsum, transform_str: str) -> str:
+    from feinsum.codegen.loopy import generate_loopy
 
-    cl_device, = cl_ctx.devices
-    device_name = _get_cl_device_name_for_db(cl_device)
-    cursor = conn.cursor()
-
-    # {{{ get available tables
-
-    cursor.execute(" SELECT name FROM sqlite_master"
-                   f" WHERE (type='table' AND name='{device_name}');")
-
-    if not cursor.fetchall():
-        # device table not available
-        logger.info(f"Table for {device_name} not in DB, creating one.")
-        cursor.execute(f"CREATE TABLE {device_name} ("
-                       " ID INTEGER PRIMARY KEY AUTOINCREMENT,"
-                       " subscripts TEXT,"
-                       " index_to_length TEXT,"
-                       " use_matrix TEXT,"
-                       " value_to_dtype TEXT,"
-                       " loopy_transform TEXT,"
-                       " runtime_in_sec REAL,"
-                       " authors TEXT,"
-                       " compiler_version TEXT,"
-                       " cl_kernel TEXT,"
-                       " giga_op_info TEXT,"
-                       " timestamp TEXT,"
-                       " remarks TEXT"
-                       ")")
+    transform_clbl = _get_clbl_from_string(transform_str)
+    # type-ignored because last 2 arguments are optional arguments and mypy
+    # cannot deduce that.
+    device_code = (lp.generate_code_v2(transform_clbl(  # type: ignore
+                                           generate_loopy(einsum)))
+                   .device_code())
+    assert isinstance(device_code, str)
+    return device_code
+
+
+def _get_row_for_db(einsum: FusedEinsum,
+                    cl_device: "cl.Device",
+                    *,
+                    runtime: float,
+                    transform_str: str,
+                    cl_kernel: Optional[str],
+                    authors: str,
+                    remarks: str,
+                    long_dim_length: int,
+                    log_performance_data: bool,
+                    ) -> Tuple[Any, ...]:
+    """
+    Returns the values to be inserted into the device's table for *einsum*
+    transformed with *transform_str* that ran in *runtime* seconds. If
+    *cl_kernel* is *None*, the device code is generated here.
+    """
+    from feinsum.normalization import normalize_einsum
+    einsum = normalize_einsum(einsum)
 
-    # }}}
+    index_to_dim_length = einsum.index_to_dim_length()
+    dtype_to_ops = _get_dtype_to_ops(
+        einsum, _get_eval_context(index_to_dim_length, long_dim_length))
 
     subscripts = einsum.get_subscripts()
-    index_to_length = _get_index_to_length_for_db(einsum)
-    transform_str = _preprocess_string_for_sql(transform_str)
+    index_to_length = _get_index_to_length_for_db(einsum, index_to_dim_length)
     use_matrix = _preprocess_string_for_sql(
         _get_use_matrix_for_db(einsum))
     value_to_dtype = _get_value_to_dtype_for_db(einsum)
-    # type-ignored because last 2 arguments are optional arguments and mypy
-    # cannot deduce that.
-    cl_kernel = _preprocess_string_for_sql(
-        lp.generate_code_v2(transform_clbl(  # type: ignore
-            generate_loopy(einsum)))
-        .device_code())
+    if cl_kernel is None:
+        cl_kernel = _generate_device_code(einsum, transform_str)
     compiler_version = _get_cl_version_for_db(cl_device)
     op_info = _preprocess_string_for_sql(
-        _get_op_info_for_db(einsum, long_dim_length=long_dim_length))
+        _get_op_info_for_db(dtype_to_ops))
 
     # {{{ logging values
 
@@ -258,42 +313,162 @@ def record(einsum: FusedEinsum,
                     + _get_log_str_for_run(einsum,
                                            runtime=runtime,
                                            device=cl_device,
-                                           long_dim_length=long_dim_length))
+                                           long_dim_length=long_dim_length,
+                                           dtype_to_ops=dtype_to_ops))
 
     # }}}
 
-    # {{{ compute timestamp in Chicago
+    timestamp = datetime.now(_get_chicago_tz()).strftime("%Y_%m_%d_%H%M%S")
+
+    return (subscripts,
+            index_to_length,
+            use_matrix,
+            value_to_dtype,
+            _preprocess_string_for_sql(transform_str),
+            runtime,
+            authors,
+            compiler_version,
+            _preprocess_string_for_sql(cl_kernel),
+            op_info,
+            timestamp,
+            _preprocess_string_for_sql(remarks))
+
+
+def _insert_rows_into_db(database: str,
+                         device_name: str,
+                         rows: Sequence[Tuple[Any, ...]]) -> None:
+    # all rows go in a single transaction => a single sync to the disk.
+    with closing(_connect(database)) as conn, conn:
+        _create_device_table_if_needed(conn, device_name)
+        conn.executemany(f"INSERT INTO {device_name}"
+                         " (subscripts, index_to_length, use_matrix,"
+                         "  value_to_dtype, loopy_transform, runtime_in_sec,"
+                         "  authors, compiler_version, cl_kernel, giga_op_info,"
+                         "  timestamp, remarks)"
+                         f" VALUES ({', '.join('?' * 12)})",
+                         rows)
 
-    import pytz
-    from datetime import datetime
 
-    timestamp = (datetime
-                .now(pytz.timezone("America/Chicago")) .strftime("%Y_%m_%d_%H%M%S"))
+def record(einsum: FusedEinsum,
+           cl_ctx: "cl.Context",
+           *,
+           transform_str: Optional[str] = None,
+           transform_file_path: Optional[str] = None,
+           authors: str,
+           remarks: str = "",
+           database: str = DEFAULT_TRANSFORM_ARCHIVE,
+           long_dim_length: int = 50_000,
+           log_performance_data: bool = True,
+           ) -> None:
+    """
+    Measures the runtime of *einsum* transformed as per the transform code and
+    records it via :func:`record_result`.
 
-    # }}}
+    :param log_performance_data: If *True* will log the run results via
+        :mod:`logging`.
+    """
+    # TODO: Instead of taking in a long_dim_length, should allow setting each
+    # parameter its value.
+    transform_str = _get_transform_str(transform_str, transform_file_path)
 
-    cursor.execute(f"INSERT INTO {device_name}"
-                   " (subscripts, index_to_length, use_matrix,"
-                   "  value_to_dtype, loopy_transform, runtime_in_sec,"
-                   "  authors, compiler_version, cl_kernel, giga_op_info,"
-                   "  timestamp, remarks)"
-                   " VALUES ("
-                   f"'{subscripts}',"         # subscripts
-                   f" '{index_to_length}',"   # index_to_length
-                   f" '{use_matrix}',"        # use_matrix
-                   f" '{value_to_dtype}',"    # value_to_dtype
-                   f" '{transform_str}',"     # loopy_transform
-                   f" {runtime},"             # runtime_in_sec
-                   f" '{authors}',"           # authors
-                   f" '{compiler_version}',"  # compiler_version
-                   f" '{cl_kernel}',"         # cl_kernel
-                   f" '{op_info}',"           # giga_op_info
-                   f" '{timestamp}',"         # timestamp
-                   f" '{remarks}'"            # remarks
-                   ")")
-
-    conn.commit()
-    conn.close()
+    if len(cl_ctx.devices) > 1:
+        raise NotImplementedError("CL contexts with multiple devices not supported")
+
+    runtime = _measure_runtime(einsum, cl_ctx,
+                               transform_str=transform_str,
+                               long_dim_length=long_dim_length)
+    record_result(einsum, cl_ctx,
+                  runtime=runtime,
+                  transform_str=transform_str,
+                  authors=authors,
+                  remarks=remarks,
+                  database=database,
+                  long_dim_length=long_dim_length,
+                  log_performance_data=log_performance_data)
+
+
+def record_result(einsum: FusedEinsum,
+                  cl_ctx: "cl.Context",
+                  *,
+                  runtime: float,
+                  transform_str: Optional[str] = None,
+                  transform_file_path: Optional[str] = None,
+                  cl_kernel: Optional[str] = None,
+                  authors: str,
+                  remarks: str = "",
+                  database: str = DEFAULT_TRANSFORM_ARCHIVE,
+                  long_dim_length: int = 50_000,
+                  log_performance_data: bool = True,
+                  ) -> None:
+    """
+    Records an already measured run of *einsum* into *database*. Unlike
+    :func:`record`, the kernel is not timed again.
+
+    :param runtime: Runtime (in seconds) of *einsum* transformed as per the
+        transform code with all its :class:`~feinsum.einsum.SizeParam` set to
+        *long_dim_length*.
+    :param cl_kernel: The device code corresponding to the transformed kernel.
+        If *None*, it is generated from the transform code.
+    :param log_performance_data: If *True* will log the run results via
+        :mod:`logging`.
+
+    .. note::
+
+        The result is stored under ``normalize_einsum(einsum)``, so *runtime*
+        and *cl_kernel* are expected to be obtained for the normalized
+        einsum, as done by :func:`record`.
+    """
+    transform_str = _get_transform_str(transform_str, transform_file_path)
+
+    if len(cl_ctx.devices) > 1:
+        raise NotImplementedError("CL contexts with multiple devices not supported")
+
+    cl_device, = cl_ctx.devices
+    row = _get_row_for_db(einsum, cl_device,
+                          runtime=runtime,
+                          transform_str=transform_str,
+                          cl_kernel=cl_kernel,
+                          authors=authors,
+                          remarks=remarks,
+                          long_dim_length=long_dim_length,
+                          log_performance_data=log_performance_data)
+    _insert_rows_into_db(database, _get_cl_device_name_for_db(cl_device), [row])
+
+
+def record_many(einsums_and_transforms: Iterable[Tuple[FusedEinsum, str]],
+                cl_ctx: "cl.Context",
+                *,
+                authors: str,
+                remarks: str = "",
+                database: str = DEFAULT_TRANSFORM_ARCHIVE,
+                long_dim_length: int = 50_000,
+                log_performance_data: bool = True,
+                ) -> None:
+    """
+    Records each pair of an einsum and its transform source in
+    *einsums_and_transforms*, similar to :func:`record`. All the entries are
+    committed to *database* in a single transaction.
+    """
+    if len(cl_ctx.devices) > 1:
+        raise NotImplementedError("CL contexts with multiple devices not supported")
+
+    cl_device, = cl_ctx.devices
+    rows = [_get_row_for_db(einsum, cl_device,
+                            runtime=_measure_runtime(
+                                einsum, cl_ctx,
+                                transform_str=transform_str,
+                                long_dim_length=long_dim_length),
+                            transform_str=transform_str,
+                            cl_kernel=None,
+                            authors=authors,
+                            remarks=remarks,
+                            long_dim_length=long_dim_length,
+                            log_performance_data=log_performance_data)
+            for einsum, transform_str in einsums_and_transforms]
+
+    if rows:
+        _insert_rows_into_db(database, _get_cl_device_name_for_db(cl_device),
+                             rows)
 
 
 @dataclass(frozen=True, eq=True, repr=True)
@@ -327,8 +502,9 @@ def query(einsum: FusedEinsum,
     # TODO: This should  somehow solve the normalized FusedEinsum problem.
     from feinsum.normalization import normalize_einsum
     einsum = normalize_einsum(einsum)
-    conn = sqlite3.connect(database)
-    cursor = conn.cursor()
+    if not os.path.exists(database):
+        logger.warn(f"No database at '{database}'.")
+        return ()
 
     if len(cl_ctx.devices) > 1:
         raise NotImplementedError("CL contexts with multiple devices not supported")
@@ -336,37 +512,43 @@ def query(einsum: FusedEinsum,
     cl_device, = cl_ctx.devices
     device_name = _get_cl_device_name_for_db(cl_device)
     subscripts = einsum.get_subscripts()
-    index_to_length = _get_index_to_length_for_db(einsum)
+    index_to_length = _get_index_to_length_for_db(einsum,
+                                                  einsum.index_to_dim_length())
     use_matrix = _preprocess_string_for_sql(
         _get_use_matrix_for_db(einsum))
     value_to_dtype = _get_value_to_dtype_for_db(einsum)
 
-    cursor.execute(" SELECT name FROM sqlite_master"
-                   f" WHERE (type='table' AND name='{device_name}');")
-
-    if not cursor.fetchall():
+    with closing(_connect(database, read_only=True)) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master"
+                       " WHERE (type='table' AND name=?);", (device_name,))
+        has_device_table = bool(cursor.fetchall())
+
+        if has_device_table:
+            cursor.execute(" SELECT"
+                           "     loopy_transform,"
+                           "     runtime_in_sec,"
+                           "     authors,"
+                           "     compiler_version,"
+                           "     cl_kernel,"
+                           "     giga_op_info,"
+                           "     timestamp,"
+                           "     remarks"
+                           "  FROM "
+                           f"    {device_name}"
+                           " WHERE ("
+                           "    subscripts = ?"
+                           "    AND index_to_length = ?"
+                           "    AND use_matrix = ?"
+                           "    AND value_to_dtype = ?"
+                           ");",
+                           (subscripts, index_to_length, use_matrix, value_to_dtype))
+            facts = cursor.fetchall()
+
+    if not has_device_table:
         logger.warn(f"No entries for {cl_device}")
         return ()
 
-    cursor.execute(" SELECT"
-                   "     loopy_transform,"
-                   "     runtime_in_sec,"
-                   "     authors,"
-                   "     compiler_version,"
-                   "     cl_kernel,"
-                   "     giga_op_info,"
-                   "     timestamp,"
-                   "     remarks"
-                   "  FROM "
-                   f"    {device_name}"
-                   f" WHERE ("
-                   f"    subscripts = '{subscripts}'"
-                   f"    AND index_to_length = '{index_to_length}'"
-                   f"    AND use_matrix = '{use_matrix}'"
-                   f"    AND value_to_dtype = '{value_to_dtype}'"
-                   ");")
-
-    facts = cursor.fetchall()
     query_result = tuple(
         QueryInfo(
             transform=_get_clbl_from_string(
@@ -375,12 +557,12 @@ def query(einsum: FusedEinsum,
             authors=fact[2],
             compiler_version=fact[3],
             cl_kernel=_postprocess_string_from_sql(fact[4]),
-            giga_op_info=_postprocess_op_info_from_sql(fact[5]),
+            giga_op_info=_postprocess_op_info_from_sql(
+                _postprocess_string_from_sql(fact[5])),
             remarks=_postprocess_string_from_sql(fact[7]),
             transform_code=_postprocess_string_from_sql(fact[0])
         )
         for fact in facts)
-    conn.close()
 
     if not query_result and err_if_no_results:
         str_idx_to_size = ", ".join(f"{einsum.index_names[idx]}: {lngth}"
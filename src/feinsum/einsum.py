@@ -112,8 +112,13 @@ class FusedEinsum:
     def noutputs(self) -> int:
         return len(self.use_matrix)
 
-    @cache
     def index_to_dim_length(self) -> PMapT[EinsumAxisAccess, ShapeComponentT]:
+        return self._index_to_dim_length
+
+    # cached on the instance: a functools.cache on the method would hash the
+    # entire einsum on every call and keep the instance alive forever.
+    @cached_property
+    def _index_to_dim_length(self) -> PMapT[EinsumAxisAccess, ShapeComponentT]:
         index_to_dim = {}
         for arg_shape, arg_axes in zip(self.arg_shapes,
                                        self.access_descriptors):
@@ -345,20 +345,14 @@ def get_roofline_flop_rate(expr: FusedEinsum, dev_name: str,
 def _strify_measured_vs_roofline(measured_flop_rate: Mapping[np.dtype[Any], float],
                                  roofline_flop_rate: Mapping[np.dtype[Any], float]
                                  ) -> str:
-    try:
-        from tabulate import tabulate
-    except ImportError:
-        raise ImportError("`tabulate` is need for pretty printing."
-                          " Install via `pip install tabulate`.")
     assert measured_flop_rate.keys() == roofline_flop_rate.keys()
-    perf_table = [["Dtype", "Measured GOps/s", "Roofline GOps/s"]]
-    for dtype in sorted(measured_flop_rate.keys(),
-                        key=lambda x: x.itemsize):
-        perf_table.append([dtype.name,
-                           f"{(measured_flop_rate[dtype]):.1f}",
-                           f"{(roofline_flop_rate[dtype]):.1f}"])
-
-    return tabulate(perf_table, tablefmt="fancy_grid")
+    header = f"{'Dtype':<10}{'Measured GOps/s':>18}{'Roofline GOps/s':>18}"
+    return "\n".join([header]
+                     + [(f"{dtype.name:<10}"
+                         f"{measured_flop_rate[dtype]:>18.1f}"
+                         f"{roofline_flop_rate[dtype]:>18.1f}")
+                        for dtype in sorted(measured_flop_rate.keys(),
+                                            key=lambda x: x.itemsize)])
 
 
 def stringify_comparison_vs_roofline(expr: FusedEinsum,
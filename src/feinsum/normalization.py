@@ -2,7 +2,9 @@
 .. autofunction:: normalize_einsum
 """
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from functools import lru_cache
+from itertools import chain
 from pyrsistent import pmap
 from feinsum.einsum import (FusedEinsum, SizeParam, FreeAxis, SummationAxis,
                             EinsumAxisAccess)
@@ -12,10 +14,22 @@ def normalize_einsum(einsum: FusedEinsum) -> FusedEinsum:
     """
     Returns a normalized form of *einsum*.
     """
+    return _normalize_einsum(einsum)
+
+
+# FusedEinsum is immutable and hashable => sweeps recording several
+# transforms for the same einsum only normalize it once.
+@lru_cache(maxsize=1024)
+def _normalize_einsum(einsum: FusedEinsum) -> FusedEinsum:
+    index_to_dim_length = einsum.index_to_dim_length()
     nfree_indices = einsum.ndim
-    nredn_indices = len([idx
-                         for idx in einsum.index_to_dim_length()
-                         if isinstance(idx, SummationAxis)])
+    nredn_indices = 0
+    idx_to_size_param: List[Tuple[EinsumAxisAccess, SizeParam]] = []
+    for idx, dim in index_to_dim_length.items():
+        if isinstance(idx, SummationAxis):
+            nredn_indices += 1
+        if isinstance(dim, SizeParam):
+            idx_to_size_param.append((idx, dim))
 
     # there are only 26 letters :)
     assert nfree_indices + nredn_indices <= 26
@@ -29,28 +43,35 @@ def normalize_einsum(einsum: FusedEinsum) -> FusedEinsum:
     for idx, ichr in zip(sorted_axes, range(97, 123)):
         index_to_new_name[idx] = chr(ichr)
 
-    old_value_to_new_value: Dict[str, str] = {}
-    new_use_matrix = []
-    for use_row in einsum.use_matrix:
-        new_use_row = []
-        for values in use_row:
-            if len(values) > 1:
-                raise NotImplementedError("Multi-values per use not yet supported.")
-            old_value, = values
-            new_value = old_value_to_new_value.setdefault(
-                old_value,
-                f"arg_{len(old_value_to_new_value)}")
-            new_use_row.append(frozenset([new_value]))
+    all_uses = list(chain.from_iterable(einsum.use_matrix))
+    if any(len(values) > 1 for values in all_uses):
+        raise NotImplementedError("Multi-values per use not yet supported.")
+    if any(len(values) == 0 for values in all_uses):
+        raise ValueError("Each use in the use matrix must refer to a value.")
+
+    # dict.fromkeys retains the order of first occurrence
+    old_value_to_new_value: Dict[str, str] = {
+        old_value: f"arg_{i}"
+        for i, old_value in enumerate(dict.fromkeys(chain.from_iterable(all_uses)))}
+
+    # one frozenset per distinct value that is shared by all its uses.
+    old_value_to_new_use = {old_value: frozenset([new_value])
+                            for old_value, new_value
+                            in old_value_to_new_value.items()}
+    new_use_matrix = tuple(tuple(old_value_to_new_use[old_value]
+                                 for old_value, in use_row)
+                           for use_row in einsum.use_matrix)
 
-        new_use_matrix.append(tuple(new_use_row))
+    if frozenset(einsum.value_to_dtype) != frozenset(old_value_to_new_value):
+        raise ValueError("Values with a dtype do not match the values used in"
+                         " the use matrix.")
 
-    new_value_to_dtypes = {old_value_to_new_value[old_val]: dtype
-                           for old_val, dtype in einsum.value_to_dtype.items()}
+    new_value_to_dtypes = {new_val: einsum.value_to_dtype[old_val]
+                           for old_val, new_val in old_value_to_new_value.items()}
 
     old_size_param_to_new_size_param: Dict[SizeParam, SizeParam] = {
         old_sz_par: SizeParam(f"N_{index_to_new_name[old_idx]}")
-        for old_idx, old_sz_par in einsum.index_to_dim_length().items()
-        if isinstance(old_sz_par, SizeParam)
+        for old_idx, old_sz_par in idx_to_size_param
     }
 
     # type-ignore reason: mypy isn't smart to see that only SizeParams of the
@@ -66,5 +87,5 @@ def normalize_einsum(einsum: FusedEinsum) -> FusedEinsum:
     return FusedEinsum(new_arg_shapes,
                        pmap(new_value_to_dtypes),
                        einsum.access_descriptors,
-                       tuple(new_use_matrix),
+                       new_use_matrix,
                        pmap(index_to_new_name))
@@ -0,0 +1,80 @@
+import feinsum as f
+import numpy as np
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class _FakeRecordingDevice:
+    name: str = "Fake Device (v1.0) @ 1GHz"
+    vendor: str = "Fake's Vendor"
+    driver_version: str = "0.1"
+
+
+@dataclass(frozen=True)
+class _FakeRecordingContext:
+    devices: tuple = (_FakeRecordingDevice(),)
+
+
+TRANSFORM_SRC = """import loopy as lp
+
+def transform(t_unit, insn_match=None, kernel_name=None):
+    # 'quotes' and ''doubled quotes'' must survive the round trip
+    return lp.split_iname(t_unit, "i", 32, outer_tag="g.0", inner_tag="l.0")
+"""
+
+
+def test_record_result_and_query_roundtrip(tmp_path, monkeypatch):
+    import feinsum.database as db
+
+    # do not depend on loopy's op counting for the dtypes being stored
+    monkeypatch.setattr(db, "_get_dtype_to_ops",
+                        lambda einsum, eval_context: {np.dtype("float32"): 1.5,
+                                                     np.dtype("float64"): 2.0})
+
+    database = str(tmp_path / "archive.db")
+    cl_ctx = _FakeRecordingContext()
+    expr = f.fused_einsum("ij,j->i",
+                          [(np.inf, 4), (4, )],
+                          value_to_dtype={"a": "float64", "b": "float32",
+                                          "c": "float64"},
+                          use_matrix=[
+                              [{"a"}, {"c"}],
+                              [{"b"}, {"c"}],
+                          ])
+    cl_kernel = "__kernel void knl()\n{\n  int x = '\\'';\n}\n"
+
+    f.record_result(expr, cl_ctx,
+                    runtime=1e-3,
+                    transform_str=TRANSFORM_SRC,
+                    cl_kernel=cl_kernel,
+                    authors="O'Brien",
+                    remarks="first line\nit's the 'second' line",
+                    database=database,
+                    log_performance_data=False)
+    f.record_many([], cl_ctx, authors="nobody", database=database)
+
+    facts = f.query(expr, cl_ctx, database=database)
+    assert len(facts) == 1
+    fact, = facts
+
+    assert fact.transform_code == TRANSFORM_SRC
+    assert callable(fact.transform)
+    assert fact.authors == "O'Brien"
+    assert fact.remarks == "first line\nit's the 'second' line"
+    assert fact.cl_kernel == cl_kernel
+    assert fact.compiler_version == "Fake's Vendor-0.1"
+    assert fact.runtime_in_sec == 1e-3
+    assert dict(fact.giga_op_info) == {np.dtype("float32"): 1.5,
+                                       np.dtype("float64"): 2.0}
+    assert fact.giga_op_rate(np.float64) == 2.0/1e-3
+
+    # an einsum that was not recorded
+    other_expr = f.fused_einsum("ij,j->i",
+                                [(np.inf, 8), (8, )],
+                                dtypes="float64",
+                                use_matrix=[[{"a"}, {"c"}]])
+    assert f.query(other_expr, cl_ctx, database=database) == ()
+
+    # unknown device
+    assert f.query(expr, f.make_fake_cl_context("Other Device"),
+                   database=database) == ()